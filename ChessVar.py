@@ -12,18 +12,266 @@
 # This project demonstrates class inheritance, rule-based game logic, algebraic notation parsing,
 # and interaction between multiple objects to model a complex board game.
 
+import random
+import sys
+
+# Squares are indexed 0–63 as row * 8 + column, where row 0 (top) is row 8 and column 0 is 'a' (in chess notation).
+# Sets of squares are represented as bitboards: integers where bit i is set if square i belongs to the set.
+
+# algebraic notation lookup tables, indexed by the byte value of a file letter or rank digit:
+# FILE_LUT maps 'a'–'h' to columns 0–7, RANK_LUT maps '1'–'8' to rows 7–0, and any other byte maps to 255
+FILE_LUT = bytearray(b'\xff' * 256)
+FILE_LUT[ord('a'):ord('h') + 1] = bytes(range(8))
+RANK_LUT = bytearray(b'\xff' * 256)
+RANK_LUT[ord('1'):ord('8') + 1] = bytes(range(7, -1, -1))
+
+# integer ids for each color (also used for whose turn it is)
+WHITE, BLACK = 0, 1
+
+# integer ids for each piece type, regardless of color
+KING, QUEEN, ROOK, BISHOP, KNIGHT, PAWN = range(6)
+
+# integer codes for each piece type and color
+PIECE_NONE = 0
+PAWN_W, ROOK_W, KNIGHT_W, BISHOP_W, QUEEN_W, KING_W = range(1, 7)
+PAWN_B, ROOK_B, KNIGHT_B, BISHOP_B, QUEEN_B, KING_B = range(7, 13)
+
+# Zobrist keys: a random 64-bit number per piece code and square (zero for PIECE_NONE),
+# XOR-ed together with ZOBRIST_TURN (while it is black's turn) to hash a position.
+# The generator is seeded so that hashes are the same in every run.
+_zobrist_random = random.Random(0)
+ZOBRIST = [[0] * 64] + [[_zobrist_random.getrandbits(64) for square in range(64)] for code in range(PAWN_W, KING_B + 1)]
+ZOBRIST_TURN = _zobrist_random.getrandbits(64)
+
+# legality of moves already checked, keyed by (position hash, square index from, square index to)
+LEGAL_MOVE_CACHE: dict[tuple[int, int, int], bool] = {}
+LEGAL_MOVE_CACHE_SIZE = 65536       # the cache is cleared once it holds this many moves
+
+
+def ring_mask(square):
+    """Return a bitboard of the 3x3 block of squares centered on the given square, clipped at the board edges."""
+    row, column = divmod(square, 8)
+    mask = 0
+    for r in range(max(row - 1, 0), min(row + 2, 8)):
+        for c in range(max(column - 1, 0), min(column + 2, 8)):
+            mask |= 1 << (r * 8 + c)
+    return mask
+
+
+# squares caught in an explosion at each square (the square itself and all adjacent squares)
+KING_RING = [ring_mask(square) for square in range(64)]
+
+# indices of the squares in KING_RING for each square
+NEIGHBOR_SQUARES = [[neighbor for neighbor in range(64) if (KING_RING[square] >> neighbor) & 1] for square in range(64)]
+
+# squares a king or knight on each square can move to
+KING_ATTACKS = [KING_RING[square] & ~(1 << square) for square in range(64)]
+KNIGHT_DELTAS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+KNIGHT_ATTACKS = [
+    sum(1 << ((row + dr) * 8 + column + dc) for dr, dc in KNIGHT_DELTAS if 0 <= row + dr <= 7 and 0 <= column + dc <= 7)
+    for row in range(8) for column in range(8)
+]
+
+
+def pawn_tables(row_step, start_row):
+    """
+    Return the tables of squares a pawn on each square can push to (ignoring blockers) and capture on,
+    for pawns moving forward by the given row step and starting on the given row.
+    """
+    pushes = []
+    captures = []
+    for row in range(8):
+        for column in range(8):
+            push = 0
+            capture = 0
+            if 0 <= row + row_step <= 7:
+                push |= 1 << ((row + row_step) * 8 + column)
+                if row == start_row:
+                    push |= 1 << ((row + 2 * row_step) * 8 + column)
+                for c in (column - 1, column + 1):
+                    if 0 <= c <= 7:
+                        capture |= 1 << ((row + row_step) * 8 + c)
+            pushes.append(push)
+            captures.append(capture)
+    return pushes, captures
+
+
+# squares a pawn on each square can push to and capture on (white pawns move up, black pawns move down)
+PAWN_PUSHES_W, PAWN_CAPTURES_W = pawn_tables(-1, 6)
+PAWN_PUSHES_B, PAWN_CAPTURES_B = pawn_tables(1, 1)
+
+# (row, column) steps along which rooks and bishops slide
+ROOK_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+BISHOP_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def sliding_attacks(square, occupied, directions):
+    """
+    Return a bitboard of the squares reachable from the given square by sliding along the given directions.
+    Each slide stops at (and includes) the first occupied square.
+    """
+    row, column = divmod(square, 8)
+    attacks = 0
+    for row_step, column_step in directions:
+        r, c = row + row_step, column + column_step
+        while 0 <= r <= 7 and 0 <= c <= 7:
+            attacks |= 1 << (r * 8 + c)
+            if (occupied >> (r * 8 + c)) & 1:
+                break
+            r += row_step
+            c += column_step
+    return attacks
+
+
+def blocker_mask(square, directions):
+    """
+    Return a bitboard of the squares that can block a slide from the given square along the given directions.
+    The last square of each slide is left out, since a piece there cannot block anything behind it.
+    """
+    row, column = divmod(square, 8)
+    mask = 0
+    for row_step, column_step in directions:
+        r, c = row + row_step, column + column_step
+        while 0 <= r + row_step <= 7 and 0 <= c + column_step <= 7:
+            mask |= 1 << (r * 8 + c)
+            r += row_step
+            c += column_step
+    return mask
+
+
+def attack_table(square, mask, directions):
+    """Return a dictionary mapping every subset of the blocker mask to the sliding attacks from the given square."""
+    table = {}
+    blockers = 0
+    while True:
+        table[blockers] = sliding_attacks(square, blockers, directions)
+        blockers = (blockers - mask) & mask     # next subset of the mask (Carry-Rippler enumeration)
+        if not blockers:
+            return table
+
+
+# sliding attacks are looked up as ROOK_ATTACKS[square][occupied & ROOK_MASKS[square]] (and likewise for bishops)
+ROOK_MASKS = [blocker_mask(square, ROOK_DIRECTIONS) for square in range(64)]
+ROOK_ATTACKS = [attack_table(square, ROOK_MASKS[square], ROOK_DIRECTIONS) for square in range(64)]
+BISHOP_MASKS = [blocker_mask(square, BISHOP_DIRECTIONS) for square in range(64)]
+BISHOP_ATTACKS = [attack_table(square, BISHOP_MASKS[square], BISHOP_DIRECTIONS) for square in range(64)]
+
+# squares on the same row or column (ROOK_LINES) and the same diagonals (BISHOP_LINES) as each square
+ROOK_LINES = [sliding_attacks(square, 0, ROOK_DIRECTIONS) for square in range(64)]
+BISHOP_LINES = [sliding_attacks(square, 0, BISHOP_DIRECTIONS) for square in range(64)]
+
+
+def rook_attacks(square, occupied):
+    """Return a bitboard of the squares a rook on the given square reaches, given the occupied squares."""
+    return ROOK_ATTACKS[square][occupied & ROOK_MASKS[square]]
+
+
+def bishop_attacks(square, occupied):
+    """Return a bitboard of the squares a bishop on the given square reaches, given the occupied squares."""
+    return BISHOP_ATTACKS[square][occupied & BISHOP_MASKS[square]]
+
+
+# Piece-specific move validators. Each takes the square indices moved FROM and TO, whether the move
+# is a capture, and the bitboard of all occupied squares, and returns True if the move is valid.
+
+def pawn_valid_w(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a white pawn."""
+    # validate a pawn's diagonal move with a capture
+    if capture:
+        return bool((PAWN_CAPTURES_W[index_from] >> index_to) & 1)
+
+    # validate a pawn's forward move with no capture (allowing to move two squares on its first move)
+    if not (PAWN_PUSHES_W[index_from] >> index_to) & 1:
+        return False
+    return index_from - index_to != 16 or not (occupied >> (index_from - 8)) & 1
+
+
+def pawn_valid_b(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a black pawn."""
+    # validate a pawn's diagonal move with a capture
+    if capture:
+        return bool((PAWN_CAPTURES_B[index_from] >> index_to) & 1)
+
+    # validate a pawn's forward move with no capture (allowing to move two squares on its first move)
+    if not (PAWN_PUSHES_B[index_from] >> index_to) & 1:
+        return False
+    return index_to - index_from != 16 or not (occupied >> (index_from + 8)) & 1
+
+
+def rook_valid(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a rook."""
+    # move is valid if the rook reaches the square moved to along its unblocked row or column
+    return bool((rook_attacks(index_from, occupied) >> index_to) & 1)
+
+
+def knight_valid(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a knight."""
+    # validate a knight's 2-by-1 or 1-by-2 L-shape movement
+    return bool((KNIGHT_ATTACKS[index_from] >> index_to) & 1)
+
+
+def bishop_valid(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a bishop."""
+    # move is valid if the bishop reaches the square moved to along its unblocked diagonals
+    return bool((bishop_attacks(index_from, occupied) >> index_to) & 1)
+
+
+def queen_valid(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a queen."""
+    # a horizontal/vertical move only needs the rook lookup, and a diagonal move only the bishop lookup
+    if (ROOK_LINES[index_from] >> index_to) & 1:
+        return bool((rook_attacks(index_from, occupied) >> index_to) & 1)
+    if (BISHOP_LINES[index_from] >> index_to) & 1:
+        return bool((bishop_attacks(index_from, occupied) >> index_to) & 1)
+    return False
+
+
+def king_valid(index_from, index_to, capture, occupied):
+    """Check if a given move is valid for a king. In Atomic Chess, kings cannot capture."""
+    # validate if king moved one square in any direction and did NOT make a capture
+    return not capture and bool((KING_ATTACKS[index_from] >> index_to) & 1)
+
+
+# validators indexed by each piece's dispatch_id (pawns have one per color, since their direction depends on it)
+VALIDATORS = (pawn_valid_w, pawn_valid_b, rook_valid, knight_valid, bishop_valid, queen_valid, king_valid)
+
+
 class Piece:
     """
     Represents a generic chess piece with a color ('w' for white or 'b' for black).
     Superclass for Pawn, Rook, Knight, Bishop, Queen, and King.
+
+    The color, color id, symbol, type letter (ptype), type id (ptype_id), and integer code are plain attributes
+    so that the move logic can read them directly; the get_* methods are kept for callers that use them.
+    The dispatch_id attribute is the index of the piece's move validator in VALIDATORS.
+    Attributes are stored in the __slots__ declared here (subclasses add none) rather than a per-instance __dict__.
     """
-    def __init__(self, color):
+    __slots__ = ('color', 'color_id', 'symbol', 'ptype', 'ptype_id', 'code', 'dispatch_id')
+
+    def __init__(self, color) -> None:
         """Initialize a piece with the given color."""
-        self._color = color
+        self.color = color
+        self.color_id = WHITE if color == 'w' else BLACK
 
     def get_color(self):
         """Return the color of the piece ('w' or 'b')."""
-        return self._color
+        return self.color
+
+    def get_color_id(self):
+        """Return the integer color id of the piece (WHITE or BLACK)."""
+        return self.color_id
+
+    def get_code(self):
+        """Return the integer code of the piece (e.g., PAWN_W or KING_B)."""
+        return self.code
+
+    def get_ptype(self):
+        """Return the type letter of the piece ('P', 'R', 'N', 'B', 'Q', or 'K')."""
+        return self.ptype
+
+    def get_ptype_id(self):
+        """Return the integer type id of the piece (KING, QUEEN, ROOK, BISHOP, KNIGHT, or PAWN)."""
+        return self.ptype_id
 
 
 class Pawn(Piece):
@@ -31,16 +279,22 @@ class Pawn(Piece):
     Represents a pawn chess piece.
     Inherits from Piece and provides pawn-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a pawn with the given color and corresponding symbol ('P_w' for white or 'P_b' for black)."""
         super().__init__(color)
-        self._symbol = 'P_' + self._color
+        self.symbol = 'P_' + self.color
+        self.ptype = 'P'
+        self.ptype_id = PAWN
+        self.code = PAWN_W if color == 'w' else PAWN_B
+        self.dispatch_id = 0 if color == 'w' else 1
 
     def get_symbol(self):
         """Return the pawn's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the pawn.
 
@@ -50,34 +304,15 @@ class Pawn(Piece):
             - row_to (int): row to which the pawn is moved
             - column_to (int): column to which the pawn is moved
             - square_to (Piece object or None): object at the square to which the pawn is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # validate a pawn's forward move with no capture (allowing to move two squares on its first move)
-        if square_to is None and column_from == column_to:
-            if self._color == "w":
-                if row_from == 6 and row_from - row_to == 2 and board[row_from - 1][column_from] is None:
-                    return True
-                if row_from - row_to == 1:
-                    return True
-            if self._color == "b":
-                if row_from == 1 and row_to - row_from == 2 and board[row_from + 1][column_from] is None:
-                    return True
-                if row_to - row_from == 1:
-                    return True
-
-        # validate a pawn's diagonal move with a capture
-        if square_to is not None and abs(column_from - column_to) == 1:
-            if self._color == 'w' and row_from - row_to == 1:
-                return True
-            if self._color == 'b' and row_to - row_from == 1:
-                return True
-
-        # move is not valid
-        return False
+        if self.color == 'w':
+            return pawn_valid_w(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
+        return pawn_valid_b(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
 
 
 class Rook(Piece):
@@ -85,16 +320,22 @@ class Rook(Piece):
     Represents a rook chess piece.
     Inherits from Piece and provides rook-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a rook with the given color and corresponding symbol ('R_w' for white or 'R_b' for black)."""
         super().__init__(color)
-        self._symbol = 'R_' + self._color
+        self.symbol = 'R_' + self.color
+        self.ptype = 'R'
+        self.ptype_id = ROOK
+        self.code = ROOK_W if color == 'w' else ROOK_B
+        self.dispatch_id = 2
 
     def get_symbol(self):
         """Return the rook's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the rook.
 
@@ -104,36 +345,13 @@ class Rook(Piece):
             - row_to (int): row to which the rook is moved
             - column_to (int): column to which the rook is moved
             - square_to (Piece object or None): object at the square to which the rook is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # validate a rook's vertical move
-        if column_from == column_to:
-            if row_from < row_to:
-                step = 1
-            else:
-                step = -1
-            for row in range(row_from + step, row_to, step):
-                if board[row][column_from] is not None:
-                    return False
-            return True
-
-        # validate a rook's horizontal move
-        if row_from == row_to:
-            if column_from < column_to:
-                step = 1
-            else:
-                step = -1
-            for column in range(column_from + step, column_to, step):
-                if board[row_from][column] is not None:
-                    return False
-            return True
-
-        # move is not valid
-        return False
+        return rook_valid(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
 
 
 class Knight(Piece):
@@ -141,16 +359,22 @@ class Knight(Piece):
     Represents a knight chess piece.
     Inherits from Piece and provides knight-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a knight with the given color and corresponding symbol ('N_w' for white or 'N_b' for black)."""
         super().__init__(color)
-        self._symbol = 'N_' + self._color
+        self.symbol = 'N_' + self.color
+        self.ptype = 'N'
+        self.ptype_id = KNIGHT
+        self.code = KNIGHT_W if color == 'w' else KNIGHT_B
+        self.dispatch_id = 3
 
     def get_symbol(self):
         """Return the knight's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the knight.
 
@@ -160,20 +384,13 @@ class Knight(Piece):
             - row_to (int): row to which the knight is moved
             - column_to (int): column to which the knight is moved
             - square_to (Piece object or None): object at the square to which the knight is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # validate a knight's 2-by-1 L-shape movement
-        two_by_one = (abs(column_from - column_to) == 2 and abs(row_from - row_to) == 1)
-
-        # validate a knight's 1-by-2 L-shape movement
-        one_by_two = (abs(column_from - column_to) == 1 and abs(row_from - row_to) == 2)
-
-        # move is not valid if both validations are False
-        return two_by_one or one_by_two
+        return knight_valid(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
 
 
 class Bishop(Piece):
@@ -181,16 +398,22 @@ class Bishop(Piece):
     Represents a bishop chess piece.
     Inherits from Piece and provides bishop-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a bishop with the given color and corresponding symbol ('B_w' for white or 'B_b' for black)."""
         super().__init__(color)
-        self._symbol = 'B_' + self._color
+        self.symbol = 'B_' + self.color
+        self.ptype = 'B'
+        self.ptype_id = BISHOP
+        self.code = BISHOP_W if color == 'w' else BISHOP_B
+        self.dispatch_id = 4
 
     def get_symbol(self):
         """Return the bishop's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the bishop.
 
@@ -200,35 +423,13 @@ class Bishop(Piece):
             - row_to (int): row to which the bishop is moved
             - column_to (int): column to which the bishop is moved
             - square_to (Piece object or None): element at the square to which the bishop is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # validate if bishop moved diagonally
-        if abs(column_from - column_to) != abs(row_from - row_to):
-            return False
-
-        # validate if diagonal path is not blocked by other pieces
-        if row_from < row_to:
-            row_step = 1
-        else:
-            row_step = -1
-        if column_from < column_to:
-            col_step = 1
-        else:
-            col_step = -1
-        next_row = row_from + row_step
-        next_column = column_from + col_step
-        while next_row != row_to and next_column != column_to:
-            if board[next_row][next_column] is not None:
-                return False
-            next_row += row_step
-            next_column += col_step
-
-        # move is valid
-        return True
+        return bishop_valid(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
 
 
 class Queen(Piece):
@@ -236,21 +437,25 @@ class Queen(Piece):
     Represents a queen chess piece.
     Inherits from Piece and provides queen-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a queen with the given color and corresponding symbol ('Q_w' for white or 'Q_b' for black)."""
         super().__init__(color)
-        self._symbol = 'Q_' + self._color
-        self._rook_movement = Rook(color)       # delegate horizontal/vertical validation
-        self._bishop_movement = Bishop(color)   # delegate diagonal validation
+        self.symbol = 'Q_' + self.color
+        self.ptype = 'Q'
+        self.ptype_id = QUEEN
+        self.code = QUEEN_W if color == 'w' else QUEEN_B
+        self.dispatch_id = 5
 
     def get_symbol(self):
         """Return the queen's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the queen.
-        Since queens combine movement abilities of rooks and bishops, validation is delegated to both movement types.
+        Since queens combine movement abilities of rooks and bishops, the move is checked as a rook or bishop move.
 
         Parameters:
             - row_from (int): row from which the queen is moved
@@ -258,20 +463,13 @@ class Queen(Piece):
             - row_to (int): row to which the queen is moved
             - column_to (int): column to which the queen is moved
             - square_to (Piece object or None): element at the square to which the queen is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # check if queen made a valid horizontal/vertical move
-        rook_move = self._rook_movement.is_move_valid(row_from, column_from, row_to, column_to, square_to, board)
-
-        # check if queen made a valid diagonal move
-        bishop_move = self._bishop_movement.is_move_valid(row_from, column_from, row_to, column_to, square_to, board)
-
-        # move is not valid if both validations are False
-        return rook_move or bishop_move
+        return queen_valid(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
 
 
 class King(Piece):
@@ -279,16 +477,22 @@ class King(Piece):
     Represents a king chess piece.
     Inherits from Piece and provides king-specific movement validation and symbol.
     """
-    def __init__(self, color):
+    __slots__ = ()
+
+    def __init__(self, color) -> None:
         """Initialize a king with the given color and corresponding symbol ('K_w' for white or 'K_b' for black)."""
         super().__init__(color)
-        self._symbol = 'K_' + self._color
+        self.symbol = 'K_' + self.color
+        self.ptype = 'K'
+        self.ptype_id = KING
+        self.code = KING_W if color == 'w' else KING_B
+        self.dispatch_id = 6
 
     def get_symbol(self):
         """Return the king's symbol."""
-        return self._symbol
+        return self.symbol
 
-    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, board):
+    def is_move_valid(self, row_from, column_from, row_to, column_to, square_to, occupied):
         """
         Check if a given move is valid for the king. In Atomic Chess, kings cannot capture.
 
@@ -298,15 +502,43 @@ class King(Piece):
             - row_to (int): row to which the king is moved
             - column_to (int): column to which the king is moved
             - square_to (Piece object or None): element at the square to which the king is moved
-            - board (list): the current state of the board (containing Piece objects or None)
+            - occupied (int): bitboard of all occupied squares
 
         Returns:
             - True if the given move is valid
             - False otherwise
         """
-        # validate if king moved one square in any direction and did NOT make a capture
-        # move is not valid if any validation is False
-        return (square_to is None) and (0 <= abs(row_from - row_to) <= 1) and (0 <= abs(column_from - column_to) <= 1)
+        return king_valid(row_from * 8 + column_from, row_to * 8 + column_to, square_to is not None, occupied)
+
+
+# Pieces hold no state beyond their color, so a single shared instance of each piece
+# is reused by every square it occupies in every game.
+WHITE_PAWN, WHITE_ROOK, WHITE_KNIGHT = Pawn('w'), Rook('w'), Knight('w')
+WHITE_BISHOP, WHITE_QUEEN, WHITE_KING = Bishop('w'), Queen('w'), King('w')
+BLACK_PAWN, BLACK_ROOK, BLACK_KNIGHT = Pawn('b'), Rook('b'), Knight('b')
+BLACK_BISHOP, BLACK_QUEEN, BLACK_KING = Bishop('b'), Queen('b'), King('b')
+
+# shared piece instance for each piece code (None for PIECE_NONE)
+PIECES = (
+    None,
+    WHITE_PAWN, WHITE_ROOK, WHITE_KNIGHT, WHITE_BISHOP, WHITE_QUEEN, WHITE_KING,
+    BLACK_PAWN, BLACK_ROOK, BLACK_KNIGHT, BLACK_BISHOP, BLACK_QUEEN, BLACK_KING,
+)
+
+# piece codes of the starting position, square by square
+START_BOARD = bytes(
+    [ROOK_B, KNIGHT_B, BISHOP_B, QUEEN_B, KING_B, BISHOP_B, KNIGHT_B, ROOK_B]
+    + [PAWN_B] * 8 + [PIECE_NONE] * 32 + [PAWN_W] * 8
+    + [ROOK_W, KNIGHT_W, BISHOP_W, QUEEN_W, KING_W, BISHOP_W, KNIGHT_W, ROOK_W]
+)
+
+# bitboards (indexed by piece code) and Zobrist hash of the starting position
+START_BITBOARDS = (0,) + tuple(
+    sum(1 << square for square in range(64) if START_BOARD[square] == code) for code in range(PAWN_W, KING_B + 1)
+)
+START_HASH = 0
+for start_square, start_code in enumerate(START_BOARD):
+    START_HASH ^= ZOBRIST[start_code][start_square]
 
 
 class ChessVar:
@@ -316,28 +548,46 @@ class ChessVar:
     Sets up the board, enforces Atomic Chess rules, validates moves,
     tracks turn order and game state, and provides board display.
     """
-    def __init__(self):
+    def __init__(self) -> None:
         """Initialize the chessboard, game state, and turn tracker."""
-        # The chessboard is a 8x8 list of lists.
-        # Index 0 (top) is row 8, and index 7 (bottom) is row 1 (in chess notation).
-        # Inner list indices 0–7 represent columns 'a' through 'h' (in chess notation).
-        self._board = [
-            [Rook('b'), Knight('b'), Bishop('b'), Queen('b'), King('b'), Bishop('b'), Knight('b'), Rook('b')],
-            [Pawn('b')] * 8,
-            [None] * 8,
-            [None] * 8,
-            [None] * 8,
-            [None] * 8,
-            [Pawn('w')] * 8,
-            [Rook('w'), Knight('w'), Bishop('w'), Queen('w'), King('w'), Bishop('w'), Knight('w'), Rook('w')],
-        ]
+        # The chessboard is a set of twelve bitboards, indexed by piece code (index PIECE_NONE is always empty).
+        # Square 0 (top left) is a8, and square 63 (bottom right) is h1 (in chess notation).
+        self._bb = list(START_BITBOARDS)
+        self._occ_w = 0xFFFF << 48          # bitboard of all squares occupied by white pieces
+        self._occ_b = 0xFFFF                # bitboard of all squares occupied by black pieces
         self._game_state = 'UNFINISHED'     # can be 'UNFINISHED','WHITE WON', or 'BLACK WON'
-        self._turn = 'w'                    # can be 'w' for white or 'b' for black
+        self._turn = WHITE                  # can be WHITE or BLACK
+        self._white_king_sq = 60            # square index of the white king (-1 once exploded)
+        self._black_king_sq = 4             # square index of the black king (-1 once exploded)
+
+        # The board is also kept as a flat array of 64 piece codes (PIECE_NONE for an empty square),
+        # so the piece on a square is found with a single index.
+        self._board = bytearray(START_BOARD)
+
+        # Zobrist hash of the position (pieces and turn), updated incrementally as pieces move and explode
+        self._hash = START_HASH
 
     def get_game_state(self):
         """Return the current game state ('UNFINISHED', 'WHITE WON', or 'BLACK WON')"""
         return self._game_state
 
+    def get_position_hash(self):
+        """Return the Zobrist hash of the current position (equal positions with the same turn hash equally)."""
+        return self._hash
+
+    def piece_at(self, square):
+        """
+        Return the piece at the given square.
+
+        Parameters:
+            - square (int): index (0–63) of the square
+
+        Returns:
+            - the Piece object at the square
+            - None if the square is empty
+        """
+        return PIECES[self._board[square]]
+
     def make_move(self, string_from, string_to):
         """
         Attempt to make a move from one square to another using algebraic notation:
@@ -362,137 +612,185 @@ class ChessVar:
         if string_from == string_to:
             return False
 
-        # convert string_from and string_to from algebraic notation into row and column indices of self._board
-        row_from = 8 - int(string_from[1])
-        column_from = ord(string_from[0]) - ord('a')
-        row_to = 8 - int(string_to[1])
-        column_to = ord(string_to[0]) - ord('a')
-
-        # object (Piece object or None) at the square FROM which a piece is moved
-        square_from = self._board[row_from][column_from]
-        # object (Piece object or None) at the square TO which a piece is moved
-        square_to = self._board[row_to][column_to]
-
-        # check if the square being moved FROM is empty or contains the opponent's piece
-        if square_from is None or square_from.get_color() != self._turn:
+        # check if string_from and string_to are a file letter followed by a rank digit
+        if len(string_from) != 2 or len(string_to) != 2:
             return False
 
-        # check if a piece is being moved TO a square outside the board
-        if not (0 <= column_to <= 7 and 0 <= row_to <= 7):
-            return False
+        # convert string_from and string_to from algebraic notation into row and column indices
+        bytes_from = string_from.encode()
+        bytes_to = string_to.encode()
+        row_from = RANK_LUT[bytes_from[1]]
+        column_from = FILE_LUT[bytes_from[0]]
+        row_to = RANK_LUT[bytes_to[1]]
+        column_to = FILE_LUT[bytes_to[0]]
 
-        # check if the square being moved TO contains the player's own piece
-        if square_to is not None and square_to.get_color() == self._turn:
+        # check if a piece is being moved FROM or TO a square outside the board (invalid characters map to 255)
+        if row_from | column_from | row_to | column_to >= 8:
             return False
 
-        # check if the move is valid in terms of piece-specific rules
-        if square_from.is_move_valid(row_from, column_from, row_to, column_to, square_to, self._board):
-
-            # if move is valid and no capture occurs, execute move by updating the board and turn
-            if square_to is None:
-                self._board[row_from][column_from] = None
-                self._board[row_to][column_to] = square_from
-                self.change_turn()
+        # square indices of the squares moved FROM and TO
+        index_from = row_from * 8 + column_from
+        index_to = row_to * 8 + column_to
+
+        # check if the move is legal, reusing the result if it was already checked in this position
+        key = (self._hash, index_from, index_to)
+        legal = LEGAL_MOVE_CACHE.get(key)
+        if legal is None:
+            legal = self.is_move_legal(index_from, index_to)
+            if len(LEGAL_MOVE_CACHE) >= LEGAL_MOVE_CACHE_SIZE:
+                LEGAL_MOVE_CACHE.clear()
+            LEGAL_MOVE_CACHE[key] = legal
+        if not legal:
+            return False
 
-            # if move is valid and a capture occurs, validate further
+        # object (Piece object) at the square FROM which a piece is moved
+        square_from = self.piece_at(index_from)
+        # object (Piece object or None) at the square TO which a piece is moved
+        square_to = self.piece_at(index_to)
+        bit_from = 1 << index_from
+        bit_to = 1 << index_to
+
+        # if no capture occurs, execute move by updating the board and turn
+        if square_to is None:
+            self._bb[square_from.code] ^= bit_from | bit_to
+            if self._turn == WHITE:
+                self._occ_w ^= bit_from | bit_to
             else:
-                # if the player's own king will explode, move is not valid and not executed
-                if self.is_own_king_exploded(row_to, column_to):
-                    return False
-
-                # execute move by updating the board
-                self._board[row_from][column_from] = None
-
-                # if the opponent's king is exploded, update the game state
-                if self.is_opponent_king_exploded(row_to, column_to):
-                    if self._turn == 'w':
-                        self._game_state = 'WHITE WON'
-                    else:
-                        self._game_state = 'BLACK WON'
-                # if not, update the turn
+                self._occ_b ^= bit_from | bit_to
+            self._hash ^= ZOBRIST[square_from.code][index_from] ^ ZOBRIST[square_from.code][index_to]
+            self._board[index_from] = PIECE_NONE
+            self._board[index_to] = square_from.code
+            if square_from.ptype_id == KING:
+                if self._turn == WHITE:
+                    self._white_king_sq = index_to
                 else:
-                    self.change_turn()
+                    self._black_king_sq = index_to
+            self.change_turn()
 
-                # execute the explosion
-                self.execute_explosion(row_to, column_to)
+        # if a capture occurs, execute the explosion
+        else:
+            opponent_king_exploded = self.scan_kings_in_blast(index_to)[1]
 
-            # move was valid and executed
-            return True
+            # execute move by updating the board
+            self._bb[square_from.code] ^= bit_from
+            if self._turn == WHITE:
+                self._occ_w ^= bit_from
+            else:
+                self._occ_b ^= bit_from
+            self._hash ^= ZOBRIST[square_from.code][index_from]
+            self._board[index_from] = PIECE_NONE
+
+            # if the opponent's king is exploded, update the game state
+            if opponent_king_exploded:
+                if self._turn == WHITE:
+                    self._game_state = 'WHITE WON'
+                else:
+                    self._game_state = 'BLACK WON'
+            # if not, update the turn
+            else:
+                self.change_turn()
 
-        # move was not executed
-        return False
+            # execute the explosion
+            self.execute_explosion(index_to)
 
-    def change_turn(self):
-        """Switch to the other player's turn."""
-        if self._turn == 'w':
-            self._turn = 'b'
-        else:
-            self._turn = 'w'
+        # move was valid and executed
+        return True
 
-    def is_own_king_exploded(self, row_to, column_to):
+    def is_move_legal(self, index_from, index_to):
         """
-        Check if the player's own king will be caught in the explosion from the attempted capture.
+        Check if a move is legal in the current position: the player moves their own piece,
+        does not capture their own piece, follows piece-specific rules, and does not explode their own king.
 
         Parameters:
-            - row_to (int): row to which the piece is moved
-            - column_to (int): column to which the piece is moved
+            - index_from (int): index (0–63) of the square from which the piece is moved
+            - index_to (int): index (0–63) of the square to which the piece is moved
 
         Returns:
-            - True if the player's own king will explode
+            - True if the given move is legal
             - False otherwise
         """
-        for row in range(max(row_to - 1, 0), min(row_to + 2, 8)):
-            for column in range(max(column_to - 1, 0), min(column_to + 2, 8)):
-                piece = self._board[row][column]
-                if piece is not None and piece.get_symbol()[0] == 'K':
-                    if piece.get_color() == self._turn:
-                        return True
-        return False
+        # object (Piece object or None) at the square FROM which a piece is moved
+        square_from = self.piece_at(index_from)
+        # object (Piece object or None) at the square TO which a piece is moved
+        square_to = self.piece_at(index_to)
+
+        # check if the square being moved FROM is empty or contains the opponent's piece
+        if square_from is None or square_from.color_id != self._turn:
+            return False
+
+        # check if the square being moved TO contains the player's own piece
+        if square_to is not None and square_to.color_id == self._turn:
+            return False
+
+        # check if the move is valid in terms of piece-specific rules
+        occupied = self._occ_w | self._occ_b
+        if not VALIDATORS[square_from.dispatch_id](index_from, index_to, square_to is not None, occupied):
+            return False
 
-    def is_opponent_king_exploded(self, row_to, column_to):
+        # if a capture occurs, the move is not legal if the player's own king will explode
+        if square_to is not None:
+            return not self.scan_kings_in_blast(index_to)[0]
+        return True
+
+    def change_turn(self):
+        """Switch to the other player's turn."""
+        self._turn ^= 1
+        self._hash ^= ZOBRIST_TURN
+
+    def scan_kings_in_blast(self, square):
         """
-        Check if the opponent's king will be caught in the explosion from the performed capture.
+        Check which kings will be caught in the explosion from the attempted capture.
 
         Parameters:
-            - row_to (int): row to which the piece is moved
-            - column_to (int): column to which the piece is moved
+            - square (int): index (0–63) of the square to which the piece is moved
 
         Returns:
-            - True if the opponent's king will explode
-            - False otherwise
+            - a tuple (own, opponent) where own is True if the player's own king will explode
+              and opponent is True if the opponent's king will explode
         """
-        for row in range(max(row_to - 1, 0), min(row_to + 2, 8)):
-            for column in range(max(column_to - 1, 0), min(column_to + 2, 8)):
-                piece = self._board[row][column]
-                if piece is not None and piece.get_symbol()[0] == 'K':
-                    if piece.get_color() != self._turn:
-                        return True
-        return False
-
-    def execute_explosion(self, row_to, column_to):
+        ring = KING_RING[square]
+        white_exploded = self._white_king_sq >= 0 and bool((ring >> self._white_king_sq) & 1)
+        black_exploded = self._black_king_sq >= 0 and bool((ring >> self._black_king_sq) & 1)
+        if self._turn == WHITE:
+            return white_exploded, black_exploded
+        return black_exploded, white_exploded
+
+    def execute_explosion(self, square):
         """
         Apply Atomic Chess explosion rules at the square of capture.
         Removes the captured piece, the capturing piece, and all adjacent non-pawn pieces.
         Pawns are only exploded when captured directly.
 
         Parameters:
-            - row_to (int): row to which the piece is moved
-            - column_to (int): column to which the piece is moved
+            - square (int): index (0–63) of the square to which the piece is moved
         """
-        for row in range(max(row_to - 1, 0), min(row_to + 2, 8)):
-            for column in range(max(column_to - 1, 0), min(column_to + 2, 8)):
-                piece = self._board[row][column]
-                if piece is not None and not (piece.get_symbol()[0] == 'P' and (row != row_to or column != column_to)):
-                    self._board[row][column] = None
+        # squares cleared by the explosion: the square of capture and every adjacent square not holding a pawn
+        blast = (KING_RING[square] & ~(self._bb[PAWN_W] | self._bb[PAWN_B])) | (1 << square)
+        for neighbor in NEIGHBOR_SQUARES[square]:
+            code = self._board[neighbor]
+            if code != PIECE_NONE and (blast >> neighbor) & 1:
+                self._bb[code] ^= 1 << neighbor
+                self._hash ^= ZOBRIST[code][neighbor]
+                self._board[neighbor] = PIECE_NONE
+                if code == KING_W:
+                    self._white_king_sq = -1
+                elif code == KING_B:
+                    self._black_king_sq = -1
+        self._occ_w &= ~blast
+        self._occ_b &= ~blast
 
     def print_board(self):
         """Print the current state of the board."""
+        # build the whole board as one string and write it to stdout at once
+        parts = []
         for row in range(8):
-            print(8 - row, end='  ')
-            for square in self._board[row]:
+            parts.append(f'{8 - row}  ')
+            for column in range(8):
+                square = self.piece_at(row * 8 + column)
                 if square is None:
-                    print(' . ', end='  ')
+                    parts.append(' .   ')
                 else:
-                    print(square.get_symbol(), end='  ')
-            print()
-        print('    a    b    c    d    e   f    g    h')
+                    parts.append(square.symbol + '  ')
+            parts.append('\n')
+        parts.append('    a    b    c    d    e   f    g    h\n')
+        sys.stdout.write(''.join(parts))